@@ -6,13 +6,54 @@ from datetime import datetime
 import numpy as np
 from textblob import TextBlob  # For sentiment analysis
 import re
+import io
+from contextlib import contextmanager
+from instagram_report import FigureBatch, ReportBuilder
+from instagram_stats import summarize_csv_files
+
+def get_sentiment(text):
+    """Return the TextBlob polarity of a caption (0 for empty captions)"""
+    if pd.isna(text) or not text.strip():
+        return 0
+    return TextBlob(text).sentiment.polarity
+
+def get_word_count(text):
+    """Return the number of words in a caption"""
+    if pd.isna(text) or not text.strip():
+        return 0
+    return len(re.findall(r'\w+', text))
+
+def add_derived_features(df):
+    """Add the engagement and caption columns used by the text reports"""
+    df = df.copy()
+    df['engagement_rate'] = (df['likes'] + df['comments']) / df['followers'] * 100
+    captions = df['caption'].fillna('')
+    df['caption_length'] = captions.apply(len)
+    df['word_count'] = captions.apply(get_word_count)
+    df['sentiment'] = captions.apply(get_sentiment)
+    return df
 
 class InstagramEDA:
-    def __init__(self, data_dir='data', output_dir='analysis_results'):
+    def __init__(self, data_dir='data', output_dir='analysis_results',
+                 large_data_threshold=50000, sample_size=10000,
+                 report_format=None, image_format='png', compress_png=False):
         self.data_dir = data_dir
         self.output_dir = output_dir
         self.dfs = {}  # Dictionary to store DataFrames for each account
         
+        # Above this many rows, plots switch to binned/sampled rendering
+        self.large_data_threshold = large_data_threshold
+        self.sample_size = sample_size
+        
+        # With a report_format ('html' or 'markdown'), each analysis section is drawn
+        # as one shared figure and everything goes into a single report per account
+        # instead of separate PNG/TXT files
+        self.report_format = report_format
+        self.image_format = image_format
+        self.compress_png = compress_png
+        self.reports = {}  # Dictionary to store ReportBuilders for each account
+        self.batch = None  # FigureBatch of the current section
+        
         # Create output directories
         os.makedirs(output_dir, exist_ok=True)
         
@@ -47,16 +88,106 @@ class InstagramEDA:
         self.dfs[username] = df
         return df
     
+    def is_large(self, df):
+        """Return True if the dataset should use binned/sampled plots"""
+        return len(df) > self.large_data_threshold
+    
+    def sample_rows(self, df, stratify_col=None):
+        """For large datasets, return about sample_size rows keeping the proportions of stratify_col"""
+        if not self.is_large(df) or len(df) <= self.sample_size:
+            return df
+        if stratify_col is None:
+            return df.sample(n=self.sample_size, random_state=42)
+        frac = self.sample_size / len(df)
+        return df.groupby(stratify_col, dropna=False).sample(frac=frac, random_state=42)
+    
+    def plot_relationship(self, df, x, y, ax=None, **scatter_kws):
+        """Scatter plot for small datasets, hexbin density plot for large ones"""
+        ax = ax or plt.gca()
+        if self.is_large(df):
+            data = df[[x, y]].dropna()
+            hb = ax.hexbin(data[x], data[y], gridsize=60, bins='log', mincnt=1, cmap='viridis')
+            plt.colorbar(hb, ax=ax, label='Posts (log scale)')
+        else:
+            sns.scatterplot(data=df, x=x, y=y, ax=ax, **scatter_kws)
+        return ax
+    
+    def begin_section(self, username, title, n_panels=0):
+        """Start a report section; in report mode its plots share one figure"""
+        if self.report_format is None:
+            return
+        # A section that raised leaves its figure behind
+        self.discard_section()
+        if username not in self.reports:
+            self.reports[username] = ReportBuilder(
+                f'Instagram EDA - {username}',
+                report_format=self.report_format,
+                image_format=self.image_format,
+                compress_png=self.compress_png
+            )
+        self.reports[username].add_section(title)
+        self.batch = FigureBatch(n_panels) if n_panels else None
+    
+    def end_section(self, username):
+        """Hand the section's shared figure over to the report"""
+        if self.batch is not None:
+            self.reports[username].add_figure(self.batch.finish())
+            self.batch = None
+    
+    def discard_section(self):
+        """Close the current section's shared figure without adding it to the report"""
+        if self.batch is not None:
+            plt.close(self.batch.fig)
+            self.batch = None
+    
+    def new_plot(self, figsize):
+        """Start a standalone figure, or move to the next panel of the section figure"""
+        if self.batch is None:
+            plt.figure(figsize=figsize)
+            return plt.gca()
+        ax = self.batch.next_axes()
+        plt.sca(ax)
+        return ax
+    
+    def save_plot(self, username, filename):
+        """Save a standalone figure as PNG (panels are saved with their section)"""
+        if self.batch is not None:
+            return
+        plt.tight_layout()
+        plt.savefig(os.path.join(self.get_account_dir(username), filename))
+        plt.close()
+    
+    @contextmanager
+    def open_text(self, username, filename):
+        """Open a text output file, or collect the text into the account's report"""
+        if self.report_format is None:
+            with open(os.path.join(self.get_account_dir(username), filename), 'w') as f:
+                yield f
+            return
+        buf = io.StringIO()
+        yield buf
+        title = os.path.splitext(filename)[0].replace('_', ' ').title()
+        self.reports[username].add_text(title, buf.getvalue())
+    
+    def write_report(self, username):
+        """Render and save the account's report; returns its path"""
+        report = self.reports.pop(username, None)
+        if report is None:
+            return None
+        path = report.save(self.get_account_dir(username))
+        print(f"Report saved to {path}")
+        return path
+    
     def analyze_missing_values(self, username):
         """Analyze and visualize missing values in the dataset"""
         df = self.dfs[username]
-        account_dir = self.get_account_dir(username)
+        self.begin_section(username, 'Missing Values', n_panels=1)
         
         missing_data = df.isnull().sum()
         missing_percentage = (missing_data / len(df)) * 100
         
         # Save missing values analysis to text file
-        with open(os.path.join(account_dir, 'missing_values_analysis.txt'), 'w') as f:
+        with self.open_text(username, 'missing_values_analysis.txt') as f:
             f.write(f"Missing Values Analysis for {username}:\n")
             f.write("-" * (28 + len(username)) + "\n")
             for col, count, percentage in zip(missing_data.index, missing_data, missing_percentage):
@@ -69,137 +200,141 @@ class InstagramEDA:
             print(f"{col}: {count} missing values ({percentage:.2f}%)")
         
         # Visualize missing values
-        plt.figure(figsize=(10, 6))
-        sns.heatmap(df.isnull(), yticklabels=False, cbar=False, cmap='viridis')
-        plt.title(f'Missing Values Heatmap - {username}')
-        plt.tight_layout()
-        plt.savefig(os.path.join(account_dir, 'missing_values_heatmap.png'))
-        plt.close()
+        self.new_plot(figsize=(10, 6))
+        if self.is_large(df):
+            # A per-row heatmap does not scale, so plot missing percentage per column
+            sns.barplot(x=missing_percentage.values, y=missing_percentage.index)
+            plt.xlabel('Missing (%)')
+            plt.title(f'Missing Values by Column - {username}')
+        else:
+            sns.heatmap(df.isnull(), yticklabels=False, cbar=False, cmap='viridis')
+            plt.title(f'Missing Values Heatmap - {username}')
+        self.save_plot(username, 'missing_values_heatmap.png')
+        self.end_section(username)
     
     def analyze_numerical_distributions(self, username):
         """Analyze and visualize distributions of numerical features"""
         df = self.dfs[username]
-        account_dir = self.get_account_dir(username)
+        self.begin_section(username, 'Numerical Distributions', n_panels=5)
         numerical_cols = ['likes', 'comments', 'followers', 'following']
+        summary = df[numerical_cols].describe()
         
         # Save summary statistics to text file
-        with open(os.path.join(account_dir, 'numerical_summary.txt'), 'w') as f:
+        with self.open_text(username, 'numerical_summary.txt') as f:
             f.write(f"Numerical Features Summary for {username}:\n")
             f.write("-" * (31 + len(username)) + "\n")
-            f.write(df[numerical_cols].describe().to_string())
+            f.write(summary.to_string())
         
         # Print to console as well
         print(f"\nNumerical Features Summary for {username}:")
         print("-" * (31 + len(username)))
-        print(df[numerical_cols].describe())
+        print(summary)
         
         # Create subplots for distributions
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
-        axes = axes.flatten()
+        if self.batch is None:
+            fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+            axes = axes.flatten()
+        else:
+            axes = [self.batch.next_axes() for _ in numerical_cols]
         
+        large = self.is_large(df)
         for i, col in enumerate(numerical_cols):
-            sns.histplot(data=df, x=col, ax=axes[i], kde=True)
+            if large:
+                # Fixed bins and no KDE keep the cost independent of the row count
+                sns.histplot(data=df, x=col, ax=axes[i], bins=50)
+            else:
+                sns.histplot(data=df, x=col, ax=axes[i], kde=True)
             axes[i].set_title(f'Distribution of {col} - {username}')
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(account_dir, 'numerical_distributions.png'))
-        plt.close()
+        self.save_plot(username, 'numerical_distributions.png')
         
         # Box plots for outlier detection
-        plt.figure(figsize=(12, 6))
-        sns.boxplot(data=df[numerical_cols])
+        self.new_plot(figsize=(12, 6))
+        sns.boxplot(data=df[numerical_cols], showfliers=not large)
         plt.title(f'Box Plots of Numerical Features - {username}')
         plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.savefig(os.path.join(account_dir, 'numerical_boxplots.png'))
-        plt.close()
+        self.save_plot(username, 'numerical_boxplots.png')
+        self.end_section(username)
     
     def analyze_temporal_patterns(self, username):
         """Analyze posting patterns over time"""
         df = self.dfs[username]
-        account_dir = self.get_account_dir(username)
+        self.begin_section(username, 'Temporal Patterns', n_panels=2)
         
         # Posts per day of week
-        plt.figure(figsize=(10, 6))
+        self.new_plot(figsize=(10, 6))
         sns.countplot(data=df, x='post_day_of_week', 
                      order=['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'])
         plt.title(f'Posts Distribution by Day of Week - {username}')
         plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.savefig(os.path.join(account_dir, 'posts_by_day.png'))
-        plt.close()
+        self.save_plot(username, 'posts_by_day.png')
         
         # Posts per hour
-        plt.figure(figsize=(12, 6))
+        self.new_plot(figsize=(12, 6))
         sns.countplot(data=df, x='post_hour')
         plt.title(f'Posts Distribution by Hour - {username}')
-        plt.tight_layout()
-        plt.savefig(os.path.join(account_dir, 'posts_by_hour.png'))
-        plt.close()
+        self.save_plot(username, 'posts_by_hour.png')
         
         # Save temporal analysis to text file
-        with open(os.path.join(account_dir, 'temporal_analysis.txt'), 'w') as f:
+        with self.open_text(username, 'temporal_analysis.txt') as f:
             f.write(f"Temporal Analysis for {username}:\n")
             f.write("-" * (23 + len(username)) + "\n")
             f.write("\nPosts by Day of Week:\n")
             f.write(df['post_day_of_week'].value_counts().to_string())
             f.write("\n\nPosts by Hour:\n")
             f.write(df['post_hour'].value_counts().to_string())
+        self.end_section(username)
     
     def analyze_engagement(self, username):
         """Analyze engagement metrics"""
         df = self.dfs[username]
-        account_dir = self.get_account_dir(username)
+        self.begin_section(username, 'Engagement', n_panels=2)
         
         # Calculate engagement rate
         df['engagement_rate'] = (df['likes'] + df['comments']) / df['followers'] * 100
         
         # Engagement rate by post type
-        plt.figure(figsize=(10, 6))
-        sns.boxplot(data=df, x='post_type', y='engagement_rate')
+        self.new_plot(figsize=(10, 6))
+        sns.boxplot(data=df, x='post_type', y='engagement_rate', showfliers=not self.is_large(df))
         plt.title(f'Engagement Rate by Post Type - {username}')
-        plt.tight_layout()
-        plt.savefig(os.path.join(account_dir, 'engagement_by_type.png'))
-        plt.close()
+        self.save_plot(username, 'engagement_by_type.png')
         
         # Scatter plot of likes vs comments
-        plt.figure(figsize=(10, 6))
-        sns.scatterplot(data=df, x='likes', y='comments', hue='post_type')
+        self.new_plot(figsize=(10, 6))
+        sns.scatterplot(data=self.sample_rows(df, stratify_col='post_type'),
+                        x='likes', y='comments', hue='post_type')
         plt.title(f'Likes vs Comments - {username}')
-        plt.tight_layout()
-        plt.savefig(os.path.join(account_dir, 'likes_vs_comments.png'))
-        plt.close()
+        self.save_plot(username, 'likes_vs_comments.png')
         
         # Save engagement analysis to text file
-        with open(os.path.join(account_dir, 'engagement_analysis.txt'), 'w') as f:
+        with self.open_text(username, 'engagement_analysis.txt') as f:
             f.write(f"Engagement Analysis for {username}:\n")
             f.write("-" * (24 + len(username)) + "\n")
             f.write("\nEngagement Rate Summary:\n")
             f.write(df['engagement_rate'].describe().to_string())
             f.write("\n\nEngagement Rate by Post Type:\n")
             f.write(df.groupby('post_type')['engagement_rate'].describe().to_string())
+        self.end_section(username)
     
     def analyze_hashtags(self, username):
         """Analyze hashtag usage"""
         df = self.dfs[username]
-        account_dir = self.get_account_dir(username)
+        self.begin_section(username, 'Hashtags', n_panels=2)
         
         # Count hashtags per post
         df['hashtag_count'] = df['hashtags'].fillna('').apply(lambda x: len(x.split(', ')) if x else 0)
         
         # Distribution of hashtag counts
-        plt.figure(figsize=(10, 6))
+        self.new_plot(figsize=(10, 6))
         sns.countplot(data=df, x='hashtag_count')
         plt.title(f'Distribution of Hashtag Counts per Post - {username}')
-        plt.tight_layout()
-        plt.savefig(os.path.join(account_dir, 'hashtag_distribution.png'))
-        plt.close()
+        self.save_plot(username, 'hashtag_distribution.png')
         
         # Most common hashtags
         all_hashtags = [tag for tags in df['hashtags'].dropna() for tag in tags.split(', ') if tags]
         
         # Save hashtag analysis to text file
-        with open(os.path.join(account_dir, 'hashtag_analysis.txt'), 'w') as f:
+        with self.open_text(username, 'hashtag_analysis.txt') as f:
             f.write(f"Hashtag Analysis for {username}:\n")
             f.write("-" * (22 + len(username)) + "\n")
             f.write("\nHashtag Count Summary:\n")
@@ -210,35 +345,30 @@ class InstagramEDA:
                 f.write("\n\nTop Hashtags:\n")
                 f.write(hashtag_counts.head(10).to_string())
                 
-                plt.figure(figsize=(12, 6))
+                self.new_plot(figsize=(12, 6))
                 sns.barplot(x=hashtag_counts.head(10).values, y=hashtag_counts.head(10).index)
                 plt.title(f'Top 10 Most Used Hashtags - {username}')
-                plt.tight_layout()
-                plt.savefig(os.path.join(account_dir, 'top_hashtags.png'))
-                plt.close()
+                self.save_plot(username, 'top_hashtags.png')
             else:
                 f.write("\nNo hashtags found in the dataset")
                 print(f"No hashtags found in the dataset for {username}")
+        self.end_section(username)
 
     def analyze_engagement_patterns(self, username):
         """Analyze detailed engagement patterns"""
         df = self.dfs[username]
-        account_dir = self.get_account_dir(username)
+        self.begin_section(username, 'Engagement Patterns', n_panels=5)
         
         # 1. Engagement by Content Type Analysis
-        plt.figure(figsize=(12, 6))
+        self.new_plot(figsize=(12, 6))
         sns.boxplot(data=df, x='post_type', y='likes', showfliers=False)
         plt.title(f'Likes Distribution by Content Type - {username}')
-        plt.tight_layout()
-        plt.savefig(os.path.join(account_dir, 'likes_by_content_type.png'))
-        plt.close()
+        self.save_plot(username, 'likes_by_content_type.png')
         
-        plt.figure(figsize=(12, 6))
+        self.new_plot(figsize=(12, 6))
         sns.boxplot(data=df, x='post_type', y='comments', showfliers=False)
         plt.title(f'Comments Distribution by Content Type - {username}')
-        plt.tight_layout()
-        plt.savefig(os.path.join(account_dir, 'comments_by_content_type.png'))
-        plt.close()
+        self.save_plot(username, 'comments_by_content_type.png')
         
         # Calculate engagement metrics by content type
         engagement_by_type = df.groupby('post_type').agg({
@@ -248,7 +378,7 @@ class InstagramEDA:
         }).round(2)
         
         # Save engagement by type analysis
-        with open(os.path.join(account_dir, 'engagement_by_type_analysis.txt'), 'w') as f:
+        with self.open_text(username, 'engagement_by_type_analysis.txt') as f:
             f.write(f"Engagement Analysis by Content Type - {username}\n")
             f.write("-" * (40 + len(username)) + "\n\n")
             f.write(engagement_by_type.to_string())
@@ -263,15 +393,13 @@ class InstagramEDA:
         }).reset_index()
         
         # Plot daily engagement trends
-        plt.figure(figsize=(15, 8))
+        self.new_plot(figsize=(15, 8))
         plt.plot(daily_engagement['date'], daily_engagement['engagement_rate'], marker='o')
         plt.title(f'Daily Engagement Rate Trend - {username}')
         plt.xlabel('Date')
         plt.ylabel('Engagement Rate (%)')
         plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.savefig(os.path.join(account_dir, 'daily_engagement_trend.png'))
-        plt.close()
+        self.save_plot(username, 'daily_engagement_trend.png')
         
         # 3. Peak Engagement Times Analysis
         # Engagement by hour
@@ -281,16 +409,14 @@ class InstagramEDA:
             'engagement_rate': 'mean'
         }).reset_index()
         
-        plt.figure(figsize=(12, 6))
+        self.new_plot(figsize=(12, 6))
         sns.lineplot(data=hourly_engagement, x='post_hour', y='engagement_rate', marker='o')
         plt.title(f'Hourly Engagement Rate Pattern - {username}')
         plt.xlabel('Hour of Day')
         plt.ylabel('Average Engagement Rate (%)')
         plt.xticks(range(24))
         plt.grid(True)
-        plt.tight_layout()
-        plt.savefig(os.path.join(account_dir, 'hourly_engagement_pattern.png'))
-        plt.close()
+        self.save_plot(username, 'hourly_engagement_pattern.png')
         
         # Engagement by day of week
         weekday_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
@@ -300,18 +426,16 @@ class InstagramEDA:
             'engagement_rate': 'mean'
         }).reindex(weekday_order)
         
-        plt.figure(figsize=(12, 6))
+        self.new_plot(figsize=(12, 6))
         sns.lineplot(data=daily_engagement, x=daily_engagement.index, y='engagement_rate', marker='o')
         plt.title(f'Weekly Engagement Pattern - {username}')
         plt.xlabel('Day of Week')
         plt.ylabel('Average Engagement Rate (%)')
         plt.grid(True)
-        plt.tight_layout()
-        plt.savefig(os.path.join(account_dir, 'weekly_engagement_pattern.png'))
-        plt.close()
+        self.save_plot(username, 'weekly_engagement_pattern.png')
         
         # Save time-based analysis
-        with open(os.path.join(account_dir, 'time_based_analysis.txt'), 'w') as f:
+        with self.open_text(username, 'time_based_analysis.txt') as f:
             f.write(f"Time-Based Engagement Analysis - {username}\n")
             f.write("-" * (30 + len(username)) + "\n\n")
             
@@ -327,92 +451,71 @@ class InstagramEDA:
             f.write("\n\nPeak Engagement Times:\n")
             f.write(f"Best Hour: {int(peak_hour['post_hour'])}:00 ({peak_hour['engagement_rate']:.2f}% engagement)\n")
             f.write(f"Best Day: {peak_day.name} ({peak_day['engagement_rate']:.2f}% engagement)\n")
+        self.end_section(username)
 
     def analyze_captions(self, username):
         """Analyze caption content and its relationship with engagement"""
         df = self.dfs[username]
-        account_dir = self.get_account_dir(username)
+        self.begin_section(username, 'Captions', n_panels=6)
         
         # 1. Caption Length Analysis
         df['caption_length'] = df['caption'].fillna('').apply(len)
         
         # Plot caption length distribution
-        plt.figure(figsize=(10, 6))
+        self.new_plot(figsize=(10, 6))
         sns.histplot(data=df, x='caption_length', bins=20)
         plt.title(f'Caption Length Distribution - {username}')
         plt.xlabel('Caption Length (characters)')
         plt.ylabel('Count')
-        plt.tight_layout()
-        plt.savefig(os.path.join(account_dir, 'caption_length_distribution.png'))
-        plt.close()
+        self.save_plot(username, 'caption_length_distribution.png')
         
         # 2. Relationship between caption length and engagement
-        plt.figure(figsize=(12, 6))
-        sns.scatterplot(data=df, x='caption_length', y='likes', alpha=0.6)
+        self.new_plot(figsize=(12, 6))
+        self.plot_relationship(df, 'caption_length', 'likes', alpha=0.6)
         plt.title(f'Caption Length vs Likes - {username}')
         plt.xlabel('Caption Length (characters)')
         plt.ylabel('Likes')
-        plt.tight_layout()
-        plt.savefig(os.path.join(account_dir, 'caption_length_vs_likes.png'))
-        plt.close()
+        self.save_plot(username, 'caption_length_vs_likes.png')
         
-        plt.figure(figsize=(12, 6))
-        sns.scatterplot(data=df, x='caption_length', y='comments', alpha=0.6)
+        self.new_plot(figsize=(12, 6))
+        self.plot_relationship(df, 'caption_length', 'comments', alpha=0.6)
         plt.title(f'Caption Length vs Comments - {username}')
         plt.xlabel('Caption Length (characters)')
         plt.ylabel('Comments')
-        plt.tight_layout()
-        plt.savefig(os.path.join(account_dir, 'caption_length_vs_comments.png'))
-        plt.close()
+        self.save_plot(username, 'caption_length_vs_comments.png')
         
         # 3. Sentiment Analysis
-        def get_sentiment(text):
-            if pd.isna(text) or not text.strip():
-                return 0
-            return TextBlob(text).sentiment.polarity
-        
         df['sentiment'] = df['caption'].fillna('').apply(get_sentiment)
         
         # Plot sentiment distribution
-        plt.figure(figsize=(10, 6))
+        self.new_plot(figsize=(10, 6))
         sns.histplot(data=df, x='sentiment', bins=20)
         plt.title(f'Caption Sentiment Distribution - {username}')
         plt.xlabel('Sentiment Polarity')
         plt.ylabel('Count')
-        plt.tight_layout()
-        plt.savefig(os.path.join(account_dir, 'sentiment_distribution.png'))
-        plt.close()
+        self.save_plot(username, 'sentiment_distribution.png')
         
         # Relationship between sentiment and engagement
-        plt.figure(figsize=(12, 6))
-        sns.scatterplot(data=df, x='sentiment', y='likes', alpha=0.6)
+        self.new_plot(figsize=(12, 6))
+        self.plot_relationship(df, 'sentiment', 'likes', alpha=0.6)
         plt.title(f'Sentiment vs Likes - {username}')
         plt.xlabel('Sentiment Polarity')
         plt.ylabel('Likes')
-        plt.tight_layout()
-        plt.savefig(os.path.join(account_dir, 'sentiment_vs_likes.png'))
-        plt.close()
+        self.save_plot(username, 'sentiment_vs_likes.png')
         
         # 4. Word Analysis
-        def get_word_count(text):
-            if pd.isna(text) or not text.strip():
-                return 0
-            return len(re.findall(r'\w+', text))
-        
         df['word_count'] = df['caption'].fillna('').apply(get_word_count)
         
         # Plot word count distribution
-        plt.figure(figsize=(10, 6))
+        self.new_plot(figsize=(10, 6))
         sns.histplot(data=df, x='word_count', bins=20)
         plt.title(f'Word Count Distribution - {username}')
         plt.xlabel('Number of Words')
         plt.ylabel('Count')
-        plt.tight_layout()
-        plt.savefig(os.path.join(account_dir, 'word_count_distribution.png'))
-        plt.close()
+        self.save_plot(username, 'word_count_distribution.png')
         
         # 5. Save textual analysis summary
-        with open(os.path.join(account_dir, 'textual_analysis_summary.txt'), 'w') as f:
+        with self.open_text(username, 'textual_analysis_summary.txt') as f:
             f.write(f"Textual Analysis Summary - {username}\n")
             f.write("-" * (25 + len(username)) + "\n\n")
             
@@ -447,19 +550,66 @@ class InstagramEDA:
             f.write("Top 5 Most Commented Captions:\n")
             top_commented = df.nlargest(5, 'comments')[['caption', 'likes', 'comments', 'sentiment']]
             f.write(top_commented.to_string())
+        self.end_section(username)
+
+    def analyze_history(self, username, chunksize=50000):
+        """Summarize every snapshot of an account in a single streaming pass"""
+        self.begin_section(username, 'Full History')
+        
+        # Newest snapshot first, so repeated posts are counted with their latest metrics
+        files = sorted((f for f in os.listdir(self.data_dir) if f.startswith(f'{username}_') and f.endswith('.csv')),
+                       reverse=True)
+        if not files:
+            raise FileNotFoundError(f"No data files found for {username}")
+        
+        numerical_cols = ['likes', 'comments', 'followers', 'following', 'engagement_rate']
+        text_cols = ['caption_length', 'word_count', 'sentiment']
+        stats = summarize_csv_files(
+            [os.path.join(self.data_dir, f) for f in files],
+            numerical_cols + text_cols,
+            group_col='post_type',
+            corr_columns=text_cols + ['likes', 'comments'],
+            chunksize=chunksize,
+            prepare=add_derived_features,
+            dedupe_col='post_id'
+        )
+        
+        with self.open_text(username, 'history_summary.txt') as f:
+            f.write(f"Full History Summary - {username}\n")
+            f.write("-" * (23 + len(username)) + "\n\n")
+            f.write(f"Snapshots: {len(files)}\n")
+            f.write("Computed in a single streaming pass; quartiles are approximate (t-digest) above 2,000 posts\n\n")
+            
+            f.write("Numerical Features Summary:\n")
+            f.write(stats.describe(numerical_cols).to_string())
+            f.write("\n\nEngagement Rate by Post Type:\n")
+            f.write(stats.group_describe('engagement_rate').to_string())
+            f.write("\n\nCaption Statistics:\n")
+            f.write(stats.describe(text_cols).to_string())
+            f.write("\n\nCorrelation Analysis:\n")
+            f.write(stats.corr().to_string())
+        self.end_section(username)
+        
+        return stats
 
     def run_full_analysis(self, usernames):
         """Run complete EDA analysis for multiple accounts"""
         for username in usernames:
             print(f"\nStarting EDA for {username}...")
-            self.load_latest_data(username)
-            self.analyze_missing_values(username)
-            self.analyze_numerical_distributions(username)
-            self.analyze_temporal_patterns(username)
-            self.analyze_engagement(username)
-            self.analyze_hashtags(username)
-            self.analyze_engagement_patterns(username)
-            self.analyze_captions(username)
+            try:
+                self.load_latest_data(username)
+                self.analyze_missing_values(username)
+                self.analyze_numerical_distributions(username)
+                self.analyze_temporal_patterns(username)
+                self.analyze_engagement(username)
+                self.analyze_hashtags(username)
+                self.analyze_engagement_patterns(username)
+                self.analyze_captions(username)
+                self.analyze_history(username)
+            finally:
+                # Even if a section fails, close its figure and save what was collected
+                self.discard_section()
+                self.write_report(username)
         
         print(f"\nEDA completed! Results are saved in the '{self.output_dir}' directory.")
 
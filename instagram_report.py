@@ -0,0 +1,128 @@
+import base64
+import html
+import io
+import math
+import os
+import matplotlib.pyplot as plt
+
+
+class FigureBatch:
+    """Lays out the plots of one report section as panels of a single shared figure"""
+
+    def __init__(self, n_panels, ncols=2, panel_size=(7, 4.5)):
+        self.ncols = min(ncols, n_panels)
+        nrows = math.ceil(n_panels / self.ncols)
+        self.fig, axes = plt.subplots(nrows, self.ncols, squeeze=False,
+                                      figsize=(panel_size[0] * self.ncols, panel_size[1] * nrows))
+        self.axes = list(axes.flatten())
+        self.used = 0
+
+    def next_axes(self):
+        """Return the next free panel"""
+        ax = self.axes[self.used]
+        self.used += 1
+        return ax
+
+    def finish(self):
+        """Drop unused panels and lay the figure out; returns the figure"""
+        for ax in self.axes[self.used:]:
+            self.fig.delaxes(ax)
+        self.fig.tight_layout()
+        return self.fig
+
+
+class ReportBuilder:
+    """
+    Collects figures and text for one account and writes a single self-contained report
+
+    Args:
+        title (str): Report title
+        report_format (str): 'html' or 'markdown'
+        image_format (str): 'png' or 'svg'
+        compress_png (bool): Optimize PNGs for size (slower to encode)
+    """
+
+    def __init__(self, title, report_format='html', image_format='png', compress_png=False):
+        if report_format not in ('html', 'markdown'):
+            raise ValueError(f"Unsupported report format: {report_format}")
+        if image_format not in ('png', 'svg'):
+            raise ValueError(f"Unsupported image format: {image_format}")
+        self.title = title
+        self.report_format = report_format
+        self.image_format = image_format
+        self.compress_png = compress_png
+        self.sections = []  # [{'title': str, 'figures': [Figure], 'texts': [(title, text)]}]
+
+    def add_section(self, title):
+        self.sections.append({'title': title, 'figures': [], 'texts': []})
+
+    def add_figure(self, fig):
+        """Attach a figure to the current section"""
+        self.sections[-1]['figures'].append(fig)
+
+    def add_text(self, title, text):
+        """Attach a text block to the current section"""
+        self.sections[-1]['texts'].append((title, text))
+
+    def encode_figure(self, fig):
+        """Encode a figure and close it; returns (mime type, payload)"""
+        buf = io.BytesIO()
+        if self.image_format == 'svg':
+            fig.savefig(buf, format='svg')
+            payload = buf.getvalue().decode('utf-8')
+            mime = 'image/svg+xml'
+        else:
+            pil_kwargs = {'optimize': True, 'compress_level': 9} if self.compress_png else None
+            fig.savefig(buf, format='png', pil_kwargs=pil_kwargs)
+            payload = base64.b64encode(buf.getvalue()).decode('ascii')
+            mime = 'image/png'
+        plt.close(fig)
+        return mime, payload
+
+    def render_image(self, mime, payload):
+        if self.report_format == 'html' and mime == 'image/svg+xml':
+            # Inline SVG needs no data URI; drop the XML prolog
+            return payload[payload.find('<svg'):]
+        if mime == 'image/svg+xml':
+            payload = base64.b64encode(payload.encode('utf-8')).decode('ascii')
+        src = f"data:{mime};base64,{payload}"
+        if self.report_format == 'html':
+            return f'<img src="{src}">'
+        return f"![]({src})"
+
+    def render(self):
+        """Encode all figures and return the report as a string"""
+        if self.report_format == 'html':
+            parts = [f"<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+                     f"<title>{html.escape(self.title)}</title>\n"
+                     "<style>body{font-family:sans-serif;margin:2em}img,svg{max-width:100%;height:auto}"
+                     "pre{background:#f6f8fa;padding:1em;overflow-x:auto}</style>\n"
+                     f"</head>\n<body>\n<h1>{html.escape(self.title)}</h1>"]
+        else:
+            parts = [f"# {self.title}"]
+
+        for section in self.sections:
+            if self.report_format == 'html':
+                parts.append(f"<h2>{html.escape(section['title'])}</h2>")
+            else:
+                parts.append(f"## {section['title']}")
+            for fig in section['figures']:
+                parts.append(self.render_image(*self.encode_figure(fig)))
+            for title, text in section['texts']:
+                if self.report_format == 'html':
+                    parts.append(f"<h3>{html.escape(title)}</h3>\n<pre>{html.escape(text)}</pre>")
+                else:
+                    parts.append(f"### {title}\n\n```\n{text}\n```")
+
+        if self.report_format == 'html':
+            parts.append("</body>\n</html>")
+        return "\n\n".join(parts) + "\n"
+
+    def save(self, directory, basename='report'):
+        """Render the report into directory and return the file path"""
+        extension = 'html' if self.report_format == 'html' else 'md'
+        path = os.path.join(directory, f'{basename}.{extension}')
+        content = self.render()
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
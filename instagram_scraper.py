@@ -7,8 +7,13 @@ import json
 import re
 import time
 
+# GraphQL query hash of a profile's timeline, copied from Profile.get_posts() in
+# instaloader 4.10.1. Keep in sync with the instaloader pin in requirements.txt.
+PROFILE_POSTS_QUERY_HASH = '003056d32c2554def87228bc3fd9668a'
+
 class InstagramScraper:
-    def __init__(self):
+    def __init__(self, login_user=None, session_file='data/.instaloader_session',
+                 cache_file='data/profile_cache.json', cache_ttl=24 * 60 * 60):
         self.L = instaloader.Instaloader(
             download_pictures=False,
             download_videos=False,
@@ -18,6 +23,113 @@ class InstagramScraper:
             save_metadata=True,
             request_timeout=30  # Increased timeout
         )
+        self.login_user = login_user
+        self.session_file = session_file
+        self.cache_file = cache_file
+        self.cache_ttl = cache_ttl  # Seconds before cached profile metadata is refetched
+        self.profile_cache = self.load_profile_cache()
+        self.load_session()
+        
+    def load_session(self):
+        """Reuse a saved (logged-in or anonymous) session, logging in if requested"""
+        if self.session_file and os.path.exists(self.session_file):
+            try:
+                self.L.load_session_from_file(self.login_user, self.session_file)
+                # The saved session may be anonymous or belong to another account
+                if not self.login_user or self.L.test_login() == self.login_user:
+                    return
+                print(f"Session in {self.session_file} is not logged in as {self.login_user}")
+            except Exception as e:
+                print(f"Could not load session from {self.session_file}: {str(e)}")
+        
+        if self.login_user:
+            self.L.interactive_login(self.login_user)
+            self.save_session()
+    
+    def save_session(self):
+        """Persist the current session cookies so later runs can reuse them"""
+        if not self.session_file:
+            return
+        session_dir = os.path.dirname(self.session_file)
+        if session_dir:
+            os.makedirs(session_dir, exist_ok=True)
+        if self.L.context.is_logged_in:
+            self.L.save_session_to_file(self.session_file)
+            return
+        # Instaloader.save_session_to_file() requires a login, so pickle the
+        # anonymous session's cookies directly (owner-only, like instaloader does)
+        with open(self.session_file, 'wb') as f:
+            os.chmod(self.session_file, 0o600)
+            self.L.context.save_session_to_file(f)
+    
+    def load_profile_cache(self):
+        """Load cached profile metadata from disk"""
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable profile cache {self.cache_file}: {str(e)}")
+            return {}
+    
+    def save_profile_cache(self):
+        """Write cached profile metadata to disk"""
+        if not self.cache_file:
+            return
+        cache_dir = os.path.dirname(self.cache_file)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            json.dump(self.profile_cache, f, ensure_ascii=False, indent=4)
+    
+    def get_profile(self, username):
+        """
+        Return an instaloader Profile and its metadata, using the cache while it is fresh
+        
+        Args:
+            username (str): Instagram username to look up
+        
+        Returns:
+            tuple: (instaloader.Profile, dict of profile metadata, bool whether it came from the cache)
+        """
+        cached = self.profile_cache.get(username)
+        if cached and time.time() - cached['cached_at'] < self.cache_ttl:
+            # Build a lightweight Profile from the cached id instead of looking up the username again
+            profile = instaloader.Profile(self.L.context, {'id': cached['user_id'], 'username': cached['username']})
+            return profile, cached, True
+        
+        profile = instaloader.Profile.from_username(self.L.context, username)
+        metadata = {
+            'user_id': profile.userid,
+            'username': profile.username,
+            'followers': profile.followers,
+            'following': profile.followees,
+            'posts_count': profile.mediacount,
+            'cached_at': time.time()
+        }
+        self.profile_cache[username] = metadata
+        self.save_profile_cache()
+        return profile, metadata, False
+    
+    def get_posts(self, profile, from_cache):
+        """
+        Return an iterator over a profile's posts
+        
+        Profile.get_posts() fetches the full profile first, which would repeat the
+        lookup the cache just saved. For cached profiles, query the timeline by the
+        cached user id directly (same query as instaloader 4.10.1's Profile.get_posts).
+        """
+        if not from_cache:
+            return profile.get_posts()
+        return instaloader.NodeIterator(
+            self.L.context,
+            PROFILE_POSTS_QUERY_HASH,
+            lambda d: d['data']['user']['edge_owner_to_timeline_media'],
+            lambda n: instaloader.Post(self.L.context, n, profile),
+            {'id': profile.userid},
+            f'https://www.instagram.com/{profile.username}/'
+        )
         
     def extract_hashtags(self, text):
         """Extract hashtags from text"""
@@ -37,15 +149,15 @@ class InstagramScraper:
             dict: Dictionary containing profile data and posts
         """
         try:
-            profile = instaloader.Profile.from_username(self.L.context, username)
+            profile, metadata, from_cache = self.get_profile(username)
             
             # Create profile data dictionary
             profile_data = {
-                'user_id': profile.userid,
-                'username': profile.username,
-                'followers': profile.followers,
-                'following': profile.followees,
-                'posts_count': profile.mediacount,
+                'user_id': metadata['user_id'],
+                'username': metadata['username'],
+                'followers': metadata['followers'],
+                'following': metadata['following'],
+                'posts_count': metadata['posts_count'],
                 'scraped_at': datetime.now().isoformat()
             }
             
@@ -54,8 +166,8 @@ class InstagramScraper:
             post_count = 0
             
             try:
-                posts_iterator = profile.get_posts()
-                total_posts = min(max_posts or profile.mediacount, profile.mediacount)
+                posts_iterator = self.get_posts(profile, from_cache)
+                total_posts = min(max_posts or profile_data['posts_count'], profile_data['posts_count'])
                 
                 print(f"\nStarting to scrape {total_posts} posts from {username}...")
                 print("Waiting 5 seconds between posts to avoid rate limiting...")
@@ -73,10 +185,10 @@ class InstagramScraper:
                         
                         post_data = {
                             'post_id': post.shortcode,
-                            'user_id': profile.userid,
-                            'username': profile.username,
-                            'followers': profile.followers,
-                            'following': profile.followees,
+                            'user_id': profile_data['user_id'],
+                            'username': profile_data['username'],
+                            'followers': profile_data['followers'],
+                            'following': profile_data['following'],
                             'post_type': 'video' if post.is_video else 'image',
                             'post_timestamp': post.date.isoformat(),
                             'likes': getattr(post, 'likes', 0),
@@ -177,6 +289,12 @@ def main():
             print(f"\nScraping completed successfully for {username}!")
         else:
             print(f"\nScraping failed for {username}!")
+    
+    # Keep the session for the next run
+    try:
+        scraper.save_session()
+    except Exception as e:
+        print(f"\nCould not save session: {str(e)}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
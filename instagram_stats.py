@@ -0,0 +1,354 @@
+import math
+import numpy as np
+import pandas as pd
+
+DESCRIBE_INDEX = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+
+
+class RunningMoments:
+    """Single-pass, mergeable count/mean/variance/min/max (Welford with Chan's merge)"""
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, values):
+        """Add a batch of values, ignoring NaNs"""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        batch = RunningMoments()
+        batch.n = len(values)
+        batch.mean = float(values.mean())
+        batch.m2 = float(((values - batch.mean) ** 2).sum())
+        batch.min = float(values.min())
+        batch.max = float(values.max())
+        self.merge(batch)
+
+    def merge(self, other):
+        """Combine another RunningMoments into this one"""
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.mean, self.m2 = other.n, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta ** 2 * self.n * other.n / n
+        self.n = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def std(self):
+        """Sample standard deviation (ddof=1, like pandas)"""
+        if self.n < 2:
+            return np.nan
+        return math.sqrt(self.m2 / (self.n - 1))
+
+
+class TDigest:
+    """
+    Mergeable streaming quantile sketch (merging t-digest)
+
+    Values are kept exactly until more than buffer_size points are held, so
+    small accounts get the same quantiles as pandas; beyond that points are
+    merged into centroids bounded by the compression parameter.
+    """
+
+    def __init__(self, compression=100, buffer_size=2000):
+        self.compression = compression
+        self.buffer_size = buffer_size
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.buffer = []
+        self.buffered = 0
+
+    def update(self, values):
+        """Add a batch of values, ignoring NaNs"""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self.buffer.append(values)
+        self.buffered += len(values)
+        if len(self.means) + self.buffered > self.buffer_size:
+            self.compress()
+
+    def merge(self, other):
+        """Combine another TDigest into this one"""
+        other.flush()
+        self.flush()
+        self.means = np.concatenate([self.means, other.means])
+        self.weights = np.concatenate([self.weights, other.weights])
+        order = np.argsort(self.means, kind='mergesort')
+        self.means, self.weights = self.means[order], self.weights[order]
+        if len(self.means) > self.buffer_size:
+            self.compress()
+        return self
+
+    def flush(self):
+        """Move buffered values into the (sorted) centroid list without merging them"""
+        if not self.buffer:
+            return
+        values = np.concatenate(self.buffer)
+        self.means = np.concatenate([self.means, values])
+        self.weights = np.concatenate([self.weights, np.ones(len(values))])
+        order = np.argsort(self.means, kind='mergesort')
+        self.means, self.weights = self.means[order], self.weights[order]
+        self.buffer = []
+        self.buffered = 0
+
+    def _k_limit(self, q):
+        """Upper quantile bound of a centroid starting at q (k1 scale function)"""
+        k = self.compression / (2 * math.pi) * math.asin(2 * q - 1) + 1
+        if k >= self.compression / 4:
+            return 1.0
+        return (math.sin(k * 2 * math.pi / self.compression) + 1) / 2
+
+    def compress(self):
+        """Merge adjacent centroids as far as the scale function allows"""
+        self.flush()
+        total = self.weights.sum()
+        if total == 0:
+            return
+        means, weights = [], []
+        cur_mean, cur_weight = self.means[0], self.weights[0]
+        weight_so_far = 0.0
+        q_limit = self._k_limit(0.0)
+        for mean, weight in zip(self.means[1:], self.weights[1:]):
+            if (weight_so_far + cur_weight + weight) / total <= q_limit:
+                cur_weight += weight
+                cur_mean += (mean - cur_mean) * weight / cur_weight
+            else:
+                means.append(cur_mean)
+                weights.append(cur_weight)
+                weight_so_far += cur_weight
+                q_limit = self._k_limit(weight_so_far / total)
+                cur_mean, cur_weight = mean, weight
+        means.append(cur_mean)
+        weights.append(cur_weight)
+        self.means, self.weights = np.array(means), np.array(weights)
+
+    def quantile(self, q, min_value=None, max_value=None):
+        """
+        Estimate the q-th quantile with linear interpolation
+
+        Each centroid sits at the centre of the ranks it covers, so with only
+        single-point centroids this matches numpy/pandas' 'linear' method.
+        """
+        self.flush()
+        if len(self.means) == 0:
+            return np.nan
+        total = self.weights.sum()
+        centers = np.cumsum(self.weights) - (self.weights + 1) / 2
+        rank = q * (total - 1)
+        xp, fp = centers, self.means
+        if min_value is not None:
+            xp, fp = np.concatenate([[0.0], xp]), np.concatenate([[min_value], fp])
+        if max_value is not None:
+            xp, fp = np.concatenate([xp, [total - 1]]), np.concatenate([fp, [max_value]])
+        return float(np.interp(rank, xp, fp))
+
+
+class ColumnSummary:
+    """Streaming equivalent of Series.describe() for one numeric column"""
+
+    def __init__(self, compression=100):
+        self.moments = RunningMoments()
+        self.digest = TDigest(compression=compression)
+
+    def update(self, values):
+        self.moments.update(values)
+        self.digest.update(values)
+
+    def merge(self, other):
+        self.moments.merge(other.moments)
+        self.digest.merge(other.digest)
+        return self
+
+    def describe(self, name=None):
+        """Return a Series laid out like pandas' describe()"""
+        m = self.moments
+        if m.n == 0:
+            return pd.Series([0.0] + [np.nan] * 7, index=DESCRIBE_INDEX, name=name)
+        quartiles = [self.digest.quantile(q, m.min, m.max) for q in (0.25, 0.5, 0.75)]
+        return pd.Series([float(m.n), m.mean, m.std, m.min] + quartiles + [m.max],
+                         index=DESCRIBE_INDEX, name=name)
+
+
+class RunningCovariance:
+    """
+    Single-pass, mergeable covariance/correlation over a fixed set of columns
+
+    Like DataFrame.corr(), each pair of columns uses the rows where both are
+    present, so every statistic is kept per (i, j) pair: mean[i, j] and
+    m2[i, j] describe column i over the rows complete in columns i and j.
+    """
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        k = len(self.columns)
+        self.n = np.zeros((k, k))
+        self.mean = np.zeros((k, k))
+        self.m2 = np.zeros((k, k))
+        self.comoment = np.zeros((k, k))
+
+    def update(self, df):
+        """Add a DataFrame chunk"""
+        values = df[self.columns].to_numpy(dtype=float)
+        present = ~np.isnan(values)
+        if not present.any():
+            return
+        # Shift by the column means so the sums below stay well conditioned
+        counts = present.sum(axis=0)
+        shift = np.divide(np.where(present, values, 0.0).sum(axis=0), counts,
+                          out=np.zeros(len(counts)), where=counts > 0)
+        shifted = np.where(present, values - shift, 0.0)
+        mask = present.astype(float)
+
+        batch = RunningCovariance(self.columns)
+        batch.n = mask.T @ mask
+        with np.errstate(divide='ignore', invalid='ignore'):
+            shifted_mean = np.where(batch.n > 0, (shifted.T @ mask) / batch.n, 0.0)
+        batch.m2 = (shifted ** 2).T @ mask - batch.n * shifted_mean ** 2
+        batch.comoment = shifted.T @ shifted - batch.n * shifted_mean * shifted_mean.T
+        batch.mean = shifted_mean + shift[:, None]
+        self.merge(batch)
+
+    def merge(self, other):
+        """Combine another RunningCovariance into this one"""
+        n = self.n + other.n
+        with np.errstate(divide='ignore', invalid='ignore'):
+            delta = np.where(n > 0, other.mean - self.mean, 0.0)
+            weight = np.where(n > 0, self.n * other.n / n, 0.0)
+            self.mean = np.where(n > 0, self.mean + delta * other.n / n, 0.0)
+        self.m2 = self.m2 + other.m2 + delta ** 2 * weight
+        self.comoment = self.comoment + other.comoment + delta * delta.T * weight
+        self.n = n
+        return self
+
+    def corr(self):
+        """Return the Pearson correlation matrix as a DataFrame, like DataFrame.corr()"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = self.comoment / np.sqrt(self.m2 * self.m2.T)
+        corr[self.n < 2] = np.nan
+        np.fill_diagonal(corr, np.where(np.diag(self.m2) > 0, 1.0, np.nan))
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+
+class StatsAccumulator:
+    """
+    Streaming, mergeable replacement for describe(), groupby().describe() and corr()
+
+    Args:
+        columns (list): Numeric columns to summarize
+        group_col (str, optional): Column to group by for grouped summaries
+        corr_columns (list, optional): Columns to include in the correlation matrix
+    """
+
+    def __init__(self, columns, group_col=None, corr_columns=None, compression=100):
+        self.columns = list(columns)
+        self.group_col = group_col
+        self.compression = compression
+        self.summaries = {col: ColumnSummary(compression) for col in self.columns}
+        self.group_summaries = {}  # group value -> {column: ColumnSummary}
+        self.covariance = RunningCovariance(corr_columns) if corr_columns else None
+
+    def update(self, df):
+        """Add a DataFrame chunk"""
+        for col in self.columns:
+            self.summaries[col].update(df[col])
+        if self.group_col is not None:
+            for key, group in df.groupby(self.group_col):
+                summaries = self.group_summaries.setdefault(
+                    key, {col: ColumnSummary(self.compression) for col in self.columns})
+                for col in self.columns:
+                    summaries[col].update(group[col])
+        if self.covariance is not None:
+            self.covariance.update(df)
+        return self
+
+    def merge(self, other):
+        """Combine partial results from another accumulator (another file, account or worker)"""
+        for col in self.columns:
+            self.summaries[col].merge(other.summaries[col])
+        for key, summaries in other.group_summaries.items():
+            if key not in self.group_summaries:
+                self.group_summaries[key] = {col: ColumnSummary(self.compression) for col in self.columns}
+            for col in self.columns:
+                self.group_summaries[key][col].merge(summaries[col])
+        if self.covariance is not None and other.covariance is not None:
+            self.covariance.merge(other.covariance)
+        return self
+
+    def describe(self, columns=None):
+        """Return a DataFrame laid out like df[columns].describe()"""
+        columns = columns or self.columns
+        return pd.DataFrame({col: self.summaries[col].describe() for col in columns})
+
+    def describe_column(self, col):
+        """Return a Series laid out like df[col].describe()"""
+        return self.summaries[col].describe(name=col)
+
+    def group_describe(self, col):
+        """Return a DataFrame laid out like df.groupby(group_col)[col].describe()"""
+        rows = {key: self.group_summaries[key][col].describe() for key in sorted(self.group_summaries)}
+        result = pd.DataFrame.from_dict(rows, orient='index', columns=DESCRIBE_INDEX)
+        result.index.name = self.group_col
+        return result
+
+    def corr(self):
+        """Return the correlation matrix over corr_columns"""
+        return self.covariance.corr()
+
+
+def summarize_csv(path, columns, group_col=None, corr_columns=None, chunksize=50000,
+                  prepare=None, dedupe_col=None, seen=None):
+    """
+    Summarize one CSV file chunk by chunk
+
+    Args:
+        path (str): CSV file to read
+        columns (list): Numeric columns to summarize
+        group_col (str, optional): Column to group by for grouped summaries
+        corr_columns (list, optional): Columns to include in the correlation matrix
+        chunksize (int): Rows read per chunk
+        prepare (callable, optional): Function applied to each chunk to derive columns
+        dedupe_col (str, optional): Skip rows whose value in this column is already in seen
+        seen (set, optional): Values of dedupe_col already counted; updated in place
+
+    Returns:
+        StatsAccumulator: Partial results for this file
+    """
+    acc = StatsAccumulator(columns, group_col=group_col, corr_columns=corr_columns)
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        if dedupe_col is not None and seen is not None:
+            chunk = chunk[~chunk[dedupe_col].isin(seen)]
+            chunk = chunk.drop_duplicates(subset=dedupe_col)
+            seen.update(chunk[dedupe_col])
+        if chunk.empty:
+            continue
+        if prepare is not None:
+            chunk = prepare(chunk)
+        acc.update(chunk)
+    return acc
+
+
+def summarize_csv_files(paths, columns, group_col=None, corr_columns=None, chunksize=50000,
+                        prepare=None, dedupe_col=None):
+    """Summarize several CSV files and merge their partial results"""
+    seen = set() if dedupe_col is not None else None
+    total = StatsAccumulator(columns, group_col=group_col, corr_columns=corr_columns)
+    for path in paths:
+        total.merge(summarize_csv(path, columns, group_col=group_col, corr_columns=corr_columns,
+                                  chunksize=chunksize, prepare=prepare, dedupe_col=dedupe_col,
+                                  seen=seen))
+    return total